@@ -1,27 +1,172 @@
 import customtkinter as ctk
 from PIL import Image
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import subprocess
 import threading
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import io
 import sys
 import os
 import json
+import logging
+import logging.handlers
+import queue
+import shutil
+import struct
+import functools
 import time
 import hashlib
+from collections import OrderedDict
+from itertools import groupby
 from datetime import datetime, date
 
+try:
+    import orjson  # optional: SIMD-accelerated JSON, ~3-5x faster parses
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
 # --- Configuration ---
 ANI_CLI_PATH = "ani-cli"
 THUMBNAIL_SIZE = (160, 225)
+# Size-stamped suffix versions the cache: old full-resolution .jpg files
+# from earlier releases are simply ignored. One sidecar file per title
+# holds a length-prefixed JSON header (synopsis) followed by the raw
+# thumbnail JPEG, so a cache hit is a single open() instead of four.
+THUMB_SUFFIX = "_%dx%d.bin" % THUMBNAIL_SIZE
 ANI_CACHE_DIR = "Ani-Cache"
 APP_DATA_FILE = "ani-gui-data.json"
 os.makedirs(ANI_CACHE_DIR, exist_ok=True)
+# Optional: jpegoptim squeezes cached thumbnails further than Pillow's
+# encoder. Probed once; Pillow's optimize=True is the fallback.
+JPEGOPTIM_PATH = shutil.which("jpegoptim")
+API_CACHE_TTL = 300  # seconds a search/episode-list response stays fresh
+UPDATE_CHECK_TTL = 6 * 3600  # seconds before a library item is re-checked for updates
+
+# Worker threads only enqueue log records; a single listener thread drains
+# the queue to stderr, so the parallel fetch/scan workers never serialize
+# on the interpreter's stdio lock.
+_log_queue = queue.SimpleQueue()
+logger = logging.getLogger("ani-gui")
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler())
+_log_listener.start()
+JIKAN_MISS_TTL = 7 * 86400  # seconds a "title not on Jikan" result is trusted
+JIKAN_MISS_PRUNE = 30 * 86400  # drop negative-cache entries older than this
+MAX_COVER_BYTES = 2_000_000  # refuse cover downloads larger than this
 # --- End Configuration ---
 
-# Lock for Jikan rate limiting
-jikan_lock = threading.Lock()
-last_jikan_time = [0]  # mutable list to store last request time
+class RateLimiter:
+    """Monotonic send-time scheduler. The lock is held only long enough to
+    claim the next send slot; the wait (and the request itself) happens
+    outside it, so workers line up send times instead of serializing whole
+    round-trips, and unthrottled work keeps flowing at full parallelism."""
+    def __init__(self, interval):
+        self.interval = interval
+        self.next_ok = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            wait = max(0.0, self.next_ok - now)
+            self.next_ok = max(now, self.next_ok) + self.interval
+        if wait:
+            time.sleep(wait)
+
+
+JIKAN_BUCKET = RateLimiter(0.5)  # Jikan allows ~2 requests per second
+
+
+def _decode_and_resize(fp):
+    """JPEG decode + resample down to THUMBNAIL_SIZE. libjpeg and the
+    resample inner loops release the GIL, so running these on a pool
+    sized to the CPU count scales across cores."""
+    pil_image = Image.open(fp)
+    # draft() lets libjpeg decode at a reduced DCT scale, so we never
+    # fully decode pixels that get thrown away anyway.
+    pil_image.draft('RGB', THUMBNAIL_SIZE)
+    pil_image.load()
+    pil_image.thumbnail(THUMBNAIL_SIZE, Image.LANCZOS)
+    return pil_image
+
+
+def _sort_episode_numbers(raw):
+    """Numeric sort for episode strings like "1" or "12.5". Pre-building
+    (float, str) pairs sorts without per-comparison key callbacks, and the
+    digit filter drops the occasional non-numeric entry the API sneaks in
+    instead of blowing up the whole episode list."""
+    pairs = [(float(ep), ep) for ep in raw if str(ep).replace('.', '', 1).isdigit()]
+    pairs.sort()
+    return [ep for _, ep in pairs]
+
+
+@functools.lru_cache(maxsize=1024)
+def _title_cache_key(title):
+    """Hex digest used as the on-disk cache name for a title. blake2b is
+    faster than md5 and available on FIPS-restricted builds; memoized since
+    the same titles come up across searches and pages."""
+    return hashlib.blake2b(title.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _make_session():
+    """Builds a requests.Session with a pooled adapter so TCP/TLS connections
+    get reused instead of re-handshaking for every single request."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16,
+                          max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class LRUCache(OrderedDict):
+    """Dict bounded to `cap` entries with least-recently-used eviction.
+    The caches are shared across worker pools, and the recency bookkeeping
+    is a multi-step operation, so get/set/pop run under a lock."""
+    def __init__(self, cap=128):
+        super().__init__()
+        self.cap = cap
+        self._lock = threading.Lock()
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.cap:
+                self.popitem(last=False)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                self.move_to_end(key)
+            except KeyError:
+                return default
+            return super().__getitem__(key)
+
+    def pop(self, key, *args):
+        with self._lock:
+            return super().pop(key, *args)
+
+    def clear(self):
+        with self._lock:
+            super().clear()
 
 
 class DataManager:
@@ -29,28 +174,53 @@ class DataManager:
     def __init__(self, file_path):
         self.file_path = file_path
         self.data = self._load_defaults()
+        # One save at a time: concurrent writers would interleave in the
+        # shared tmp file and os.replace would install the mangled result.
+        self._save_lock = threading.Lock()
 
     def _load_defaults(self):
-        return {"history": [], "library": {}}
+        return {"history": [], "library": {}, "jikan_negatives": {}}
 
     def load(self):
         try:
             if os.path.exists(self.file_path):
-                with open(self.file_path, 'r', encoding='utf-8') as f:
-                    loaded_data = json.load(f)
+                with open(self.file_path, 'rb') as f:
+                    loaded_data = _json_loads(f.read())
                     defaults = self._load_defaults()
                     defaults.update(loaded_data)
                     self.data = defaults
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading data file: {e}. Starting with fresh data.")
+        except (ValueError, IOError) as e:
+            logger.warning(f"Error loading data file: {e}. Starting with fresh data.")
             self.data = self._load_defaults()
+        # Drop stale negative-cache entries so the dict can't grow forever.
+        cutoff = time.time() - JIKAN_MISS_PRUNE
+        negatives = self.data["jikan_negatives"]
+        for key in [k for k, ts in negatives.items() if ts < cutoff]:
+            del negatives[key]
+        # Scrub episode lists that older builds let leak into the saved
+        # library: they freeze at whatever had aired when they were written.
+        for entry in self.data["library"].values():
+            entry.pop('episodes_detail', None)
+            entry.pop('detail_mode', None)
 
     def save(self):
+        """Saves on a worker thread so the Tk thread never stalls on I/O."""
+        threading.Thread(target=self.save_now, daemon=True).start()
+
+    def save_now(self):
         try:
-            with open(self.file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=4)
-        except IOError as e:
-            print(f"Error saving data file: {e}")
+            with self._save_lock:
+                payload = _json_dumps(self.data)
+                # Write-then-rename keeps the data file intact even if the
+                # process dies mid-write.
+                tmp_path = self.file_path + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self.file_path)
+        except (IOError, OSError, RuntimeError, TypeError, ValueError) as e:
+            # RuntimeError/TypeError/ValueError cover a worker mutating the
+            # dicts mid-serialize or an unserializable value sneaking in.
+            logger.error(f"Error saving data file: {e}")
 
     def get(self, key):
         return self.data.get(key)
@@ -66,33 +236,98 @@ class AniAPI:
         self.api_refr = "https://allmanga.to"
         self.agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/121.0"
         self.headers = {"User-Agent": self.agent, "Referer": self.api_refr}
+        self._http = _make_session()
+        # TTL memo for search/episode responses: repeating a recent query
+        # becomes a dict lookup instead of a network round-trip.
+        self._response_cache = LRUCache(cap=64)
+
+        # Minified query strings: these go out on every request, and the
+        # unused __typename field only inflated each edge in the response.
+        self.shows_gql = (
+            'query($search:SearchInput,$limit:Int,$page:Int,'
+            '$translationType:VaildTranslationTypeEnumType,'
+            '$countryOrigin:VaildCountryOriginEnumType){'
+            'shows(search:$search,limit:$limit,page:$page,'
+            'translationType:$translationType,countryOrigin:$countryOrigin){'
+            'edges{_id name availableEpisodes availableEpisodesDetail}}}'
+        )
+        self.episodes_list_gql = (
+            'query($showId:String!){show(_id:$showId){_id availableEpisodesDetail}}'
+        )
+        # Projection for the update check, which only compares episode
+        # counts: no names and no per-episode detail, so the response is a
+        # fraction of the full search payload.
+        self.shows_lite_gql = (
+            'query($search:SearchInput,$limit:Int,$page:Int,'
+            '$translationType:VaildTranslationTypeEnumType,'
+            '$countryOrigin:VaildCountryOriginEnumType){'
+            'shows(search:$search,limit:$limit,page:$page,'
+            'translationType:$translationType,countryOrigin:$countryOrigin){'
+            'edges{_id availableEpisodes}}}'
+        )
+
+    def _cached(self, key):
+        hit = self._response_cache.get(key)
+        if hit and time.time() - hit[0] < API_CACHE_TTL:
+            return hit[1]
+        return None
 
-        self.shows_gql = '''
-        query($search: SearchInput, $limit: Int, $page: Int, $translationType: VaildTranslationTypeEnumType, $countryOrigin: VaildCountryOriginEnumType) {
-          shows(search: $search, limit: $limit, page: $page, translationType: $translationType, countryOrigin: $countryOrigin) {
-            edges { _id name availableEpisodes __typename }
-          }
-        }
-        '''
-        self.episodes_list_gql = '''
-        query ($showId: String!) {
-          show(_id: $showId) { _id availableEpisodesDetail }
-        }
-        '''
+    def _remember(self, key, value):
+        self._response_cache[key] = (time.time(), value)
+        return value
+
+    def invalidate(self, query=None, mode='sub'):
+        """Drops cached search responses so the next lookup hits the network.
+        With a query, evicts just that search (memory and disk); without one,
+        clears the whole in-memory TTL cache."""
+        if query is None:
+            self._response_cache.clear()
+            return
+        self._response_cache.pop(("search", query, mode), None)
+        self._response_cache.pop(("counts", query, mode), None)
+        try:
+            os.remove(self._search_cache_path(query, mode))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _search_cache_path(query, mode):
+        digest = hashlib.blake2b(f"{query}|{mode}".encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(ANI_CACHE_DIR, f"search_{digest}.json")
 
     def _make_request(self, query_template, variables):
-        params = {"variables": json.dumps(variables), "query": query_template}
-        response = requests.get(self.api_url, params=params, headers=self.headers, timeout=20)
+        # POST with a JSON body: no URL-encoding a multi-KB query string,
+        # and no risk of tripping proxy URL-length limits.
+        response = self._http.post(self.api_url,
+                                   json={"query": query_template, "variables": variables},
+                                   headers=self.headers, timeout=20)
         response.raise_for_status()
-        return response.json()['data']
+        return _json_loads(response.content)['data']
 
     def search(self, query, mode='sub'):
+        key = ("search", query, mode)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        disk_path = self._search_cache_path(query, mode)
+        try:
+            if os.path.exists(disk_path) and time.time() - os.path.getmtime(disk_path) < API_CACHE_TTL:
+                with open(disk_path, 'rb') as f:
+                    return self._remember(key, _json_loads(f.read()))
+        except (json.JSONDecodeError, IOError, OSError):
+            pass
         variables = {
             "search": {"allowAdult": False, "allowUnknown": False, "query": query},
             "limit": 40, "page": 1, "translationType": mode, "countryOrigin": "ALL"
         }
         data = self._make_request(self.shows_gql, variables)['shows']['edges']
-        return self._format_results(data, mode)
+        results = self._format_results(data, mode)
+        try:
+            with open(disk_path, 'w', encoding='utf-8') as f:
+                f.write(_json_dumps(results))
+        except IOError:
+            pass
+        return self._remember(key, results)
 
     def browse(self, mode='sub', sort_by="update", page=1):
         # Simplified browse function
@@ -109,24 +344,95 @@ class AniAPI:
     def _format_results(self, data, mode):
         results = []
         for index, item in enumerate(data):
-            results.append({
+            result = {
                 "index": index + 1,
                 "id": item['_id'],
                 "title": item['name'],
                 "episodes": item['availableEpisodes'].get(mode, 0)
-            })
+            }
+            # The search query asks for the episode detail inline, so a
+            # later select usually needs no second round-trip. The list is
+            # tagged with the mode it was fetched under; consumers must not
+            # use it after the user flips Sub/Dub.
+            detail = item.get('availableEpisodesDetail') or {}
+            if detail.get(mode):
+                result['episodes_detail'] = _sort_episode_numbers(detail[mode])
+                result['detail_mode'] = mode
+            results.append(result)
+        return results
+
+    def get_episode_counts(self, query, mode='sub', fresh=False):
+        """Lightweight search for the update check: fetches only ids and
+        episode counts and returns {show_id: count}. With fresh=True the
+        TTL memo is bypassed (the result still refills it)."""
+        key = ("counts", query, mode)
+        if not fresh:
+            cached = self._cached(key)
+            if cached is not None:
+                return cached
+        variables = {
+            "search": {"allowAdult": False, "allowUnknown": False, "query": query},
+            "limit": 40, "page": 1, "translationType": mode, "countryOrigin": "ALL"
+        }
+        data = self._make_request(self.shows_lite_gql, variables)['shows']['edges']
+        counts = {item['_id']: item['availableEpisodes'].get(mode, 0) for item in data}
+        return self._remember(key, counts)
+
+    def get_episodes_bulk(self, show_ids, mode='sub'):
+        """Fetches episode lists for several shows at once using GraphQL
+        aliases (s0: show(...), s1: show(...), ...), chunked at 20 shows per
+        request to stay under URL-length limits. Returns {show_id: episodes}
+        and feeds the same TTL cache get_episodes uses."""
+        results = {}
+        pending = []
+        for show_id in show_ids:
+            cached = self._cached(("episodes", show_id, mode))
+            if cached is not None:
+                results[show_id] = cached
+            else:
+                pending.append(show_id)
+        for start in range(0, len(pending), 20):
+            chunk = pending[start:start + 20]
+            aliases = " ".join('s%d: show(_id: "%s") { _id availableEpisodesDetail }' % (i, show_id)
+                               for i, show_id in enumerate(chunk))
+            data = self._make_request("query { %s }" % aliases, {})
+            for i, show_id in enumerate(chunk):
+                show = data.get('s%d' % i) or {}
+                episodes = (show.get('availableEpisodesDetail') or {}).get(mode, [])
+                results[show_id] = self._remember(("episodes", show_id, mode), _sort_episode_numbers(episodes))
         return results
 
     def get_episodes(self, show_id, mode='sub'):
+        key = ("episodes", show_id, mode)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
         variables = {"showId": show_id}
         data = self._make_request(self.episodes_list_gql, variables)
         episodes_data = data['show']['availableEpisodesDetail'].get(mode, [])
-        return sorted(episodes_data, key=float)
+        return self._remember(key, _sort_episode_numbers(episodes_data))
 
 class AniCliGUI(ctk.CTk):
     def __init__(self):
         super().__init__()
         self.api = AniAPI()
+        self._http = _make_session()
+        # One long-lived worker pool for all detail/image I/O. Reusing the
+        # same threads across searches avoids paying 40 thread creations
+        # (and their stacks) every time the user hits Search.
+        self._io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ani-io")
+        # Separate CPU pool for image decode/resample so download workers
+        # are never stuck behind a Lanczos pass and vice versa.
+        self._decode_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 2,
+                                               thread_name_prefix="ani-decode")
+        # Collapses concurrent Jikan lookups for the same title (library and
+        # updates views can queue duplicates) into a single network request:
+        # later workers wait on the per-title lock and then hit the cache.
+        self._detail_locks = {}
+        self._detail_locks_guard = threading.Lock()
+        # Hot in-memory layer over the sidecar files: repeat lookups for a
+        # title need zero syscalls. Maps cache_base -> (synopsis, PIL image).
+        self._detail_mem_cache = LRUCache(cap=256)
         self.data_manager = DataManager(APP_DATA_FILE)
         self.data_manager.load()
 
@@ -140,18 +446,54 @@ class AniCliGUI(ctk.CTk):
         self.selected_anime_title = None
         self.selected_episode = None
         self.last_query = ""
-        self.thumbnail_cache = {}
+        self.thumbnail_cache = LRUCache(cap=128)
+        self._episode_render_job = 0
+        self._history_render_job = 0
+        self._results_gen = 0
+        self._pending_status = None
+        self._status_flush_scheduled = False
+        self._data_flush_scheduled = False
+        self._update_cancel = threading.Event()
+        self._update_future = None
         self.placeholder_image = self._create_placeholder_image()
+        # Shared font object: CTkFont allocates a Tk font per instance, so
+        # building one per history header scales with history length.
+        self._bold_font = ctk.CTkFont(weight="bold")
         self.current_browse_page = 1
 
         self._setup_ui()
+        # Every frame that hosts result tiles; _apply_thumbnail walks these
+        # so a tile keeps getting its image even if another page rendered
+        # in the meantime.
+        self._result_frames = [self.anime_results_frame, self.browse_results_frame,
+                               self.library_results_frame, self.updates_frame]
         self._setup_bindings()
         self.protocol("WM_DELETE_WINDOW", self.on_closing)
         self._hide_details_panel()
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self):
+        """Best-effort pre-initialization while the user is still looking at
+        the empty UI: forces libjpeg/TLS one-time setup and opens a warm
+        connection to the API so the first search skips those costs."""
+        try:
+            buf = io.BytesIO()
+            Image.new('RGB', (1, 1)).save(buf, 'JPEG')
+            buf.seek(0)
+            Image.open(buf).load()
+            import ssl
+            ssl.create_default_context()
+            self.api._http.get(self.api.api_url, headers=self.api.headers, timeout=2)
+        except Exception:
+            pass
 
     def on_closing(self):
         self._update_status("Saving data...")
-        self.data_manager.save()
+        self.data_manager.save_now()
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._decode_pool.shutdown(wait=False, cancel_futures=True)
+        self._http.close()
+        self.api._http.close()
         self.destroy()
 
     def _create_placeholder_image(self):
@@ -159,8 +501,7 @@ class AniCliGUI(ctk.CTk):
         return ctk.CTkImage(light_image=image, dark_image=image, size=THUMBNAIL_SIZE)
 
     def _get_cache_base(self, title):
-        safe_name = hashlib.md5(title.encode("utf-8")).hexdigest()
-        return os.path.join(ANI_CACHE_DIR, safe_name)
+        return os.path.join(ANI_CACHE_DIR, _title_cache_key(title))
 
     def _setup_ui(self):
         self.grid_columnconfigure(1, weight=1)
@@ -377,6 +718,9 @@ class AniCliGUI(ctk.CTk):
 
         self.check_updates_button = ctk.CTkButton(tabview.tab("Updates"), text="Check for Updates", command=self.check_for_updates)
         self.check_updates_button.pack(pady=10)
+        self.force_refresh_var = ctk.BooleanVar(value=False)
+        self.force_refresh_checkbox = ctk.CTkCheckBox(tabview.tab("Updates"), text="Force refresh", variable=self.force_refresh_var)
+        self.force_refresh_checkbox.pack(pady=(0, 10))
 
         self.pages["library"] = page
 
@@ -406,8 +750,16 @@ class AniCliGUI(ctk.CTk):
         self.bind_all("<Control-A>", self._select_all_text)
 
     def _on_mousewheel(self, event):
-        x, y = self.winfo_pointerxy()
-        widget = self.winfo_containing(x, y)
+        # On X11/aqua wheel events arrive at the widget under the pointer,
+        # so event.widget replaces the old winfo_pointerxy/winfo_containing
+        # pair (two Tcl round-trips per wheel tick); what's left is a plain
+        # attribute walk up to the owning scrollable frame. Windows Tk 8.6
+        # delivers <MouseWheel> to the focus widget instead, so there the
+        # pointer lookup is still needed.
+        if sys.platform == "win32":
+            widget = self.winfo_containing(*self.winfo_pointerxy())
+        else:
+            widget = event.widget if not isinstance(event.widget, str) else None
         while widget is not None and not isinstance(widget, ctk.CTkScrollableFrame):
             widget = widget.master
         if isinstance(widget, ctk.CTkScrollableFrame):
@@ -421,12 +773,35 @@ class AniCliGUI(ctk.CTk):
             return "break"
         return None
 
+    def _clear_children(self, frame, chunk=20):
+        """Empties a frame without stalling the mainloop: pooled tiles are
+        hidden for recycling, everything else is unmapped at once and then
+        destroyed in event-sized batches via after(1, ...)."""
+        pool = getattr(frame, "_tile_pool", ())
+        for btn in pool: btn.grid_forget()
+        frame._render_keys = None
+        doomed = [w for w in frame.winfo_children() if w not in pool]
+        for w in doomed:
+            w.pack_forget()
+
+        def _destroy_chunk(i=0):
+            for w in doomed[i:i + chunk]:
+                w.destroy()
+            if i + chunk < len(doomed):
+                self.after(1, _destroy_chunk, i + chunk)
+        _destroy_chunk()
+
     def _clear_frames(self, anime=True, episodes=True, description=True):
         target_frames = []
         if anime: target_frames.extend([self.anime_results_frame, self.browse_results_frame, self.library_results_frame, self.updates_frame])
-        if episodes: target_frames.append(self.episode_list_frame)
+        if episodes:
+            target_frames.append(self.episode_list_frame)
+            # Cancel any chunked render still in flight: its remaining
+            # after(1) passes would otherwise keep packing the old show's
+            # buttons into the freshly cleared frame.
+            self._episode_render_job += 1
         for frame in target_frames:
-            for widget in frame.winfo_children(): widget.destroy()
+            self._clear_children(frame)
         if description:
             self.description_textbox.configure(state="normal")
             self.description_textbox.delete("1.0", "end")
@@ -436,6 +811,21 @@ class AniCliGUI(ctk.CTk):
         self.status_bar.configure(text=message)
         self.update_idletasks()
 
+    def _update_status_coalesced(self, message):
+        """Status setter for bursty callers: keeps only the latest message
+        and repaints at most every 100 ms, instead of forcing a synchronous
+        update_idletasks per message."""
+        self._pending_status = message
+        if not self._status_flush_scheduled:
+            self._status_flush_scheduled = True
+            self.after(100, self._flush_status)
+
+    def _flush_status(self):
+        self._status_flush_scheduled = False
+        if self._pending_status is not None:
+            self.status_bar.configure(text=self._pending_status)
+            self._pending_status = None
+
     def search_anime(self, event=None):
         query = self.search_entry.get()
         if not query:
@@ -447,100 +837,251 @@ class AniCliGUI(ctk.CTk):
         self._clear_frames(anime=True, episodes=True, description=True)
         self.play_button.configure(state="disabled")
         self.download_button.configure(state="disabled")
-        self.thumbnail_cache.clear()
         self._hide_details_panel()
-        threading.Thread(target=self._search_thread, args=(query,)).start()
+        self._results_gen += 1
+        threading.Thread(target=self._search_thread, args=(query, self._results_gen), daemon=True).start()
 
     def browse_anime(self, page_num=1):
         self.current_browse_page = page_num
         self._update_status(f"Browsing anime... Page {self.current_browse_page}")
         self._clear_frames(anime=True, episodes=True, description=True)
-        self.thumbnail_cache.clear()
         self.page_label.configure(text=f"Page: {self.current_browse_page}")
         self.prev_page_button.configure(state="normal" if self.current_browse_page > 1 else "disabled")
         self._hide_details_panel()
         sort_by = self.browse_sort_var.get()
-        threading.Thread(target=self._browse_thread, args=(sort_by, self.current_browse_page)).start()
+        self._results_gen += 1
+        threading.Thread(target=self._browse_thread, args=(sort_by, self.current_browse_page, self._results_gen), daemon=True).start()
 
     def next_browse_page(self): self.browse_anime(page_num=self.current_browse_page + 1)
     def prev_browse_page(self):
         if self.current_browse_page > 1: self.browse_anime(page_num=self.current_browse_page - 1)
             
-    def _search_thread(self, query):
+    def _search_thread(self, query, gen):
         try:
             mode = self.mode_var.get()
             self.anime_list = self.api.search(query, mode)
-            self._process_fetched_results(self.anime_list, self.anime_results_frame, f"No results found for '{query}'.")
+            self._process_fetched_results(self.anime_list, self.anime_results_frame, f"No results found for '{query}'.", gen)
         except Exception as e:
             self.after(0, self._update_status, f"An error occurred: {e}")
         finally:
             self.after(0, self.search_button.configure, {"state": "normal"})
-            
-    def _browse_thread(self, sort_by, page):
+
+    def _browse_thread(self, sort_by, page, gen):
         try:
             mode = self.mode_var.get()
             self.anime_list = self.api.browse(mode, sort_by, page)
-            self._process_fetched_results(self.anime_list, self.browse_results_frame, "No anime found.")
+            self._process_fetched_results(self.anime_list, self.browse_results_frame, "No anime found.", gen)
         except Exception as e:
             self.after(0, self._update_status, f"An error occurred: {e}")
-    
-    def _process_fetched_results(self, results, target_frame, not_found_msg):
+
+    def _process_fetched_results(self, results, target_frame, not_found_msg, gen):
+        # Generation check: if the user already kicked off another search or
+        # page change, this run's results must never reach the UI.
+        def if_current(callback, *args):
+            if gen == self._results_gen:
+                callback(*args)
         if not results:
-            self.after(0, self._update_status, not_found_msg)
+            self.after(0, if_current, self._update_status, not_found_msg)
             return
-        self.after(0, self._update_status, f"Found {len(results)} results. Fetching details...")
-        threads = [threading.Thread(target=self._fetch_details_for_item, args=(item,)) for item in results]
-        for t in threads: t.start()
-        for t in threads: t.join()
-        self.after(0, self._populate_anime_results, results, target_frame)
-        self.after(0, self._update_status, "Details loaded. Please select an anime.")
+        # Paint the grid immediately with placeholders; thumbnails pop in
+        # one by one instead of the page gating on the slowest fetch.
+        self.after(0, if_current, self._populate_anime_results, results, target_frame)
+        self.after(0, if_current, self._update_status_coalesced, f"Found {len(results)} results. Fetching details...")
+        list(self._io_pool.map(self._fetch_details_for_item, results))
+        self.after(0, if_current, self._update_status_coalesced, "Details loaded. Please select an anime.")
 
     def _fetch_details_for_item(self, anime_item):
+        cache_base = self._get_cache_base(anime_item['title'])
+        with self._detail_locks_guard:
+            title_lock = self._detail_locks.setdefault(cache_base, threading.Lock())
+        with title_lock:
+            self._fetch_details_locked(anime_item, cache_base)
+
+    @staticmethod
+    def _read_detail_sidecar(path):
+        """Returns (meta dict, jpeg bytes) from a combined sidecar file."""
+        with open(path, 'rb') as f:
+            meta_len = struct.unpack("<I", f.read(4))[0]
+            meta = _json_loads(f.read(meta_len))
+            return meta, f.read()
+
+    @staticmethod
+    def _write_detail_sidecar(path, meta, jpeg_bytes):
+        meta_json = _json_dumps(meta).encode("utf-8")
+        with open(path, 'wb') as f:
+            f.write(struct.pack("<I", len(meta_json)))
+            f.write(meta_json)
+            f.write(jpeg_bytes)
+
+    def _fetch_details_locked(self, anime_item, cache_base):
         try:
-            cache_base = self._get_cache_base(anime_item['title'])
-            img_path, meta_path = cache_base + ".jpg", cache_base + ".json"
-            if os.path.exists(img_path) and os.path.exists(meta_path):
-                with open(meta_path, "r", encoding="utf-8") as f: meta = json.load(f)
+            cached = self._detail_mem_cache.get(cache_base)
+            if cached is not None:
+                anime_item['synopsis'] = cached[0]
+                self.after(0, self._apply_thumbnail, anime_item['id'], cached[1])
+                return
+            sidecar_path = cache_base + THUMB_SUFFIX
+            try:
+                # Try the open directly instead of a stat pre-check: the
+                # common hit path costs one syscall instead of two.
+                meta, jpeg_bytes = self._read_detail_sidecar(sidecar_path)
+            except FileNotFoundError:
+                meta = None
+            if meta is not None:
                 anime_item['synopsis'] = meta.get("synopsis", "No description.")
-                pil_image = Image.open(img_path)
-                self.thumbnail_cache[anime_item['id']] = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=THUMBNAIL_SIZE)
+                # Cached files are already at THUMBNAIL_SIZE; decode on the CPU pool.
+                pil_image = self._decode_pool.submit(_decode_and_resize, io.BytesIO(jpeg_bytes)).result()
+                self._detail_mem_cache[cache_base] = (anime_item['synopsis'], pil_image)
+                self.after(0, self._apply_thumbnail, anime_item['id'], pil_image)
                 return
-            with jikan_lock:
-                elapsed = time.time() - last_jikan_time[0]
-                if elapsed < 0.5: time.sleep(0.5 - elapsed)
-                last_jikan_time[0] = time.time()
-                response = requests.get(f"https://api.jikan.moe/v4/anime?q={anime_item['title']}&limit=1", timeout=10)
-                response.raise_for_status()
-                data = response.json().get('data', [])
+            # Negative cache: titles Jikan doesn't know stay expensive to
+            # re-ask (rate-limit wait + round-trip), so trust a recent miss.
+            # Lives in the app data file, so it persists across restarts.
+            negatives = self.data_manager.get("jikan_negatives")
+            miss_key = os.path.basename(cache_base)
+            if time.time() - negatives.get(miss_key, 0) < JIKAN_MISS_TTL:
+                anime_item['synopsis'] = 'No description available.'
+                self._detail_mem_cache[cache_base] = (anime_item['synopsis'], None)
+                self.after(0, self._apply_thumbnail, anime_item['id'], None)
+                return
+            JIKAN_BUCKET.acquire()
+            response = self._http.get(f"https://api.jikan.moe/v4/anime?q={anime_item['title']}&limit=1", timeout=10)
+            response.raise_for_status()
+            data = _json_loads(response.content).get('data', [])
             if data and 'images' in data[0]:
                 synopsis = data[0].get('synopsis', 'No description available.')
                 anime_item['synopsis'] = synopsis
                 image_url = data[0]['images']['jpg']['image_url']
-                with open(meta_path, "w", encoding="utf-8") as f: json.dump({"synopsis": synopsis}, f)
-                image_response = requests.get(image_url, timeout=10)
+                # Stream the download with a hard size cap so one oversized
+                # CDN image can't balloon memory or stall the fan-out.
+                image_response = self._http.get(image_url, stream=True, timeout=10)
                 image_response.raise_for_status()
-                with open(img_path, "wb") as f: f.write(image_response.content)
-                pil_image = Image.open(io.BytesIO(image_response.content))
-                self.thumbnail_cache[anime_item['id']] = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=THUMBNAIL_SIZE)
+                if int(image_response.headers.get("Content-Length", "0")) > MAX_COVER_BYTES:
+                    raise ValueError(f"cover image too large: {image_url}")
+                buf = io.BytesIO()
+                for chunk in image_response.iter_content(64 * 1024):
+                    buf.write(chunk)
+                    if buf.tell() > MAX_COVER_BYTES:
+                        raise ValueError(f"cover image too large: {image_url}")
+                buf.seek(0)
+                pil_image = self._decode_pool.submit(_decode_and_resize, buf).result()
+                # Cache the downscaled version, not the original: future runs
+                # read ~8x fewer bytes and skip the resample entirely.
+                jpeg_bytes = self._encode_thumbnail(pil_image)
+                self._write_detail_sidecar(sidecar_path, {"synopsis": synopsis}, jpeg_bytes)
+                self._detail_mem_cache[cache_base] = (synopsis, pil_image)
+                self.after(0, self._apply_thumbnail, anime_item['id'], pil_image)
                 return
+            # Jikan had nothing for this title: remember that so the next
+            # search skips the lookup until the TTL expires.
+            negatives[miss_key] = time.time()
         except Exception as e:
-            print(f"Could not fetch details for {anime_item['title']}: {e}")
+            logger.warning(f"Could not fetch details for {anime_item['title']}: {e}")
         anime_item['synopsis'] = 'No description available.'
-        self.thumbnail_cache[anime_item['id']] = self.placeholder_image
+        self.after(0, self._apply_thumbnail, anime_item['id'], None)
+
+    @staticmethod
+    def _encode_thumbnail(pil_image):
+        if pil_image.mode != 'RGB':
+            # Occasional palette/alpha sources can't be written as JPEG.
+            pil_image = pil_image.convert('RGB')
+        buf = io.BytesIO()
+        pil_image.save(buf, 'JPEG', quality=85, optimize=True, progressive=True)
+        jpeg_bytes = buf.getvalue()
+        if JPEGOPTIM_PATH:
+            proc = subprocess.run(
+                [JPEGOPTIM_PATH, '--strip-all', '--all-progressive', '--quiet', '--stdin', '--stdout'],
+                input=jpeg_bytes, capture_output=True, check=False)
+            if proc.returncode == 0 and proc.stdout:
+                jpeg_bytes = proc.stdout
+        return jpeg_bytes
+
+    def _apply_thumbnail(self, item_id, pil_image):
+        """Runs on the Tk thread. Workers hand over the decoded PIL image
+        (or None for the placeholder); the CTkImage/PhotoImage is built
+        here because Tk photo objects are not thread-safe."""
+        cached = self.thumbnail_cache.get(item_id)
+        if cached is not None and (pil_image is None or cached is not self.placeholder_image):
+            # Same show seen on another page/search: reuse the CTkImage
+            # (and its Tk photo handle) instead of allocating a twin.
+            image = cached
+        elif pil_image is None:
+            image = self.placeholder_image
+        else:
+            image = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=THUMBNAIL_SIZE)
+        self.thumbnail_cache[item_id] = image
+        for frame in self._result_frames:
+            btn = getattr(frame, "_buttons_by_id", {}).get(item_id)
+            if btn is not None and btn.winfo_exists():
+                btn.configure(image=image)
     
     def _populate_anime_results(self, results, target_frame):
-        for widget in target_frame.winfo_children(): widget.destroy()
+        # Diff-render short-circuit: re-showing an identical list (library
+        # page revisits, update checks that found nothing new) keeps the
+        # tiles as they are instead of reconfiguring every one.
+        keys = [(item['id'], item['episodes']) for item in results]
+        if keys and keys == getattr(target_frame, "_render_keys", None):
+            pool = target_frame._tile_pool
+            for i, item in enumerate(results):
+                pool[i]._item = item
+            target_frame._buttons_by_id = {item['id']: pool[i] for i, item in enumerate(results)}
+            return
+        buttons_by_id = target_frame._buttons_by_id = {}
         cols = 3
-        for i in range(cols): target_frame.grid_columnconfigure(i, weight=1, uniform="col")
-        for r in range((len(results) + cols - 1) // cols): target_frame.grid_rowconfigure(r, weight=1)
+        # Column weights only need to be set once per frame; repeating it
+        # (and the per-row configure) every search just forces extra Tk
+        # geometry recalculations.
+        if not getattr(target_frame, "_grid_configured", False):
+            for i in range(cols): target_frame.grid_columnconfigure(i, weight=1, uniform="col")
+            target_frame._grid_configured = True
+        # Tk widget destruction/creation is the slowest part of a refresh;
+        # recycle a per-frame pool of tiles and just reconfigure them.
+        pool = getattr(target_frame, "_tile_pool", None)
+        if pool is None:
+            pool = target_frame._tile_pool = []
+        for widget in target_frame.winfo_children():
+            if widget not in pool: widget.destroy()
         for index, item in enumerate(results):
             row, col = divmod(index, cols)
             thumbnail = self.thumbnail_cache.get(item['id'], self.placeholder_image)
             display_text = f"{item['title']}\n({item['episodes']} eps)"
-            btn = ctk.CTkButton(target_frame, text=display_text, image=thumbnail, compound="top", anchor="center")
-            btn.configure(command=lambda current_item=item: self.select_anime(current_item))
+            if index < len(pool):
+                btn = pool[index]
+            else:
+                btn = ctk.CTkButton(target_frame, compound="top", anchor="center")
+                # CTkButton.bind always appends (add=True), so binding per
+                # render would stack one handler per search. Bind once at
+                # creation and dispatch through the tile's current item.
+                btn.bind("<Button-3>", lambda event, b=btn: self._show_context_menu(event, b._item))
+                pool.append(btn)
+            btn._item = item
+            btn.configure(text=display_text, image=thumbnail,
+                          command=lambda b=btn: self.select_anime(b._item))
             btn.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
-            btn.bind("<Button-3>", lambda event, current_item=item: self._show_context_menu(event, current_item))
+            buttons_by_id[item['id']] = btn
+        for btn in pool[len(results):]:
+            btn.grid_forget()
+        target_frame._render_keys = keys
+        # Warm the episode lists for the first screenful of tiles that the
+        # search response didn't already include, so selecting one of them
+        # needs no extra round-trip.
+        mode = self.mode_var.get()
+        missing = [item for item in results[:12]
+                   if not item.get('episodes_detail') or item.get('detail_mode') != mode]
+        if missing:
+            self._io_pool.submit(self._prefetch_episodes, missing, mode)
+
+    def _prefetch_episodes(self, items, mode):
+        try:
+            # get_episodes_bulk feeds the ("episodes", id, mode) TTL memo,
+            # which is where select_anime's fetch fallback looks. Nothing is
+            # stashed on the item dicts: the library view hands the live
+            # data_manager dicts to the renderer, and writing the episode
+            # list there would persist it — the staleness add_to_library
+            # deliberately strips out.
+            self.api.get_episodes_bulk([item['id'] for item in items], mode)
+        except Exception as e:
+            logger.warning(f"Episode prefetch failed: {e}")
 
     def select_anime(self, item):
         self._show_details_panel()
@@ -551,8 +1092,15 @@ class AniCliGUI(ctk.CTk):
         self.description_textbox.configure(state="normal")
         self.description_textbox.insert("1.0", item.get('synopsis', 'No description available.'))
         self.description_textbox.configure(state="disabled")
-        self._update_status(f"Fetching episodes for '{item['title']}'...")
-        threading.Thread(target=self._get_episodes_thread).start()
+        episodes = item.get('episodes_detail')
+        if episodes and item.get('detail_mode') == self.mode_var.get():
+            # Already came back with the search response, in the mode that
+            # is still selected.
+            self._populate_episodes(episodes)
+            self._update_status(f"Select an episode for '{item['title']}'.")
+        else:
+            self._update_status(f"Fetching episodes for '{item['title']}'...")
+            threading.Thread(target=self._get_episodes_thread, daemon=True).start()
 
     def _get_episodes_thread(self):
         try:
@@ -566,9 +1114,21 @@ class AniCliGUI(ctk.CTk):
     def _populate_episodes(self, episodes):
         close_btn = ctk.CTkButton(self.episode_list_frame, text="X", command=self._hide_details_panel, width=28, height=28, anchor="center")
         close_btn.place(relx=1.0, x=-5, y=0, anchor="ne")
-        for ep_num in episodes:
+        # Long-running shows can have 500+ episodes; building that many
+        # Tk widgets in one go freezes the mainloop. Render in chunks so
+        # input and paint events interleave. (A job counter drops stale
+        # chunks if the user selects another anime mid-render.)
+        self._episode_render_job += 1
+        self._render_episode_chunk(list(episodes), 0, self._episode_render_job)
+
+    def _render_episode_chunk(self, episodes, start, job, chunk=40):
+        if job != self._episode_render_job:
+            return
+        for ep_num in episodes[start:start + chunk]:
             btn = ctk.CTkButton(self.episode_list_frame, text=f"Episode {ep_num}", fg_color="transparent", command=lambda e=ep_num: self.select_episode(e))
             btn.pack(fill="x", padx=5, pady=2)
+        if start + chunk < len(episodes):
+            self.after(1, self._render_episode_chunk, episodes, start + chunk, job)
 
     def select_episode(self, ep_num):
         self.selected_episode = ep_num
@@ -606,25 +1166,56 @@ class AniCliGUI(ctk.CTk):
         if not history or (history[-1]['title'] != new_entry['title'] or history[-1]['episode'] != new_entry['episode']):
             history.append(new_entry)
             self.data_manager.set("history", history)
+            self._schedule_flush()
             self._update_status(f"Added '{self.selected_anime_title} - Ep {self.selected_episode}' to history.")
 
+    def _schedule_flush(self):
+        """Coalesces bursts of history/library mutations into a single disk
+        write 500ms later. Before this, mutations lived only in memory until
+        the app closed, so a crash lost them."""
+        if self._data_flush_scheduled:
+            return
+        self._data_flush_scheduled = True
+        self.after(500, self._flush_data)
+
+    def _flush_data(self):
+        self._data_flush_scheduled = False
+        self.data_manager.save()
+
     def _populate_history_frame(self):
-        for widget in self.history_frame.winfo_children(): widget.destroy()
+        self._clear_children(self.history_frame)
         history = sorted(self.data_manager.get("history"), key=lambda x: x['timestamp'], reverse=True)
-        today, yesterday = date.today(), date.fromtimestamp(time.time() - 86400)
-        last_date_str = None
-        for item in history:
-            dt_object = datetime.fromisoformat(item['timestamp'])
-            item_date = dt_object.date()
-            if item_date == today: date_str = "Today"
-            elif item_date == yesterday: date_str = "Yesterday"
-            else: date_str = item_date.strftime("%A, %B %d, %Y")
-            if date_str != last_date_str:
-                ctk.CTkLabel(self.history_frame, text=date_str, font=ctk.CTkFont(weight="bold")).pack(anchor="w", padx=10, pady=(10,5))
-                last_date_str = date_str
-            entry_text = f"{dt_object.strftime('%I:%M %p')} - {item['title']} - Episode {item['episode']}"
-            btn = ctk.CTkButton(self.history_frame, text=entry_text, fg_color="transparent", anchor="w", command=lambda i=item: self._play_from_history(i))
+        # Memoizes header text per calendar date so strftime runs once per
+        # unique day, not once per entry.
+        date_cache = {date.today(): "Today", date.fromtimestamp(time.time() - 86400): "Yesterday"}
+        # Group by calendar date up front: one (None, header) row per day
+        # followed by its (datetime, item) rows. Timestamps are parsed once
+        # here, and the renderer no longer compares header strings per row.
+        rows = []
+        parsed = [(datetime.fromisoformat(item['timestamp']), item) for item in history]
+        for item_date, day_rows in groupby(parsed, key=lambda pair: pair[0].date()):
+            date_str = date_cache.get(item_date)
+            if date_str is None:
+                date_str = date_cache.setdefault(item_date, item_date.strftime("%A, %B %d, %Y"))
+            rows.append((None, date_str))
+            rows.extend(day_rows)
+        self._history_render_job += 1
+        self._render_history_chunk(rows, 0, self._history_render_job)
+
+    def _render_history_chunk(self, rows, start, job, chunk=40):
+        # Same event-sized-quanta scheme as the episode list: a long history
+        # renders 40 rows per mainloop pass so scrolling stays responsive.
+        if job != self._history_render_job:
+            return
+        for dt_object, payload in rows[start:start + chunk]:
+            if dt_object is None:
+                ctk.CTkLabel(self.history_frame, text=payload, font=self._bold_font).pack(anchor="w", padx=10, pady=(10,5))
+                continue
+            entry_text = f"{dt_object.strftime('%I:%M %p')} - {payload['title']} - Episode {payload['episode']}"
+            btn = ctk.CTkButton(self.history_frame, text=entry_text, fg_color="transparent", anchor="w", command=lambda i=payload: self._play_from_history(i))
             btn.pack(fill="x", padx=10, pady=2)
+        if start + chunk < len(rows):
+            self.after(1, self._render_history_chunk, rows, start + chunk, job)
 
     def _play_from_history(self, item):
         self.last_query = item['query']
@@ -647,8 +1238,16 @@ class AniCliGUI(ctk.CTk):
 
     def add_to_library(self, item, menu):
         library = self.data_manager.get("library")
-        library[item['id']] = item
+        # Persist a copy without the cached episode list: it goes stale as
+        # soon as a new episode airs (or the mode flips), and select_anime
+        # falls back to a live fetch when it is absent.
+        library[item['id']] = {k: v for k, v in item.items()
+                               if k not in ('episodes_detail', 'detail_mode')}
         self.data_manager.set("library", library)
+        self._schedule_flush()
+        # A just-added show should be re-checked on the next update scan
+        # rather than served from a stale cached search.
+        self.api.invalidate(item['title'], self.mode_var.get())
         self._update_status(f"Added '{item['title']}' to library.")
         self._populate_library_frame()
         menu.destroy()
@@ -658,6 +1257,8 @@ class AniCliGUI(ctk.CTk):
         if item_id in library:
             title = library.pop(item_id)['title']
             self.data_manager.set("library", library)
+            self._schedule_flush()
+            self.api.invalidate(title, self.mode_var.get())
             self._update_status(f"Removed '{title}' from library.")
             self._populate_library_frame()
         if menu: menu.destroy()
@@ -668,25 +1269,67 @@ class AniCliGUI(ctk.CTk):
     def check_for_updates(self):
         self.check_updates_button.configure(state="disabled", text="Checking...")
         self._update_status("Checking for new episodes in your library...")
-        threading.Thread(target=self._check_for_updates_thread).start()
-    
-    def _check_for_updates_thread(self):
+        # Signal any scan still in flight, then hand a fresh token to the
+        # new one so two runs never race on the same library dict. The scan
+        # reuses the shared pool instead of spawning a thread per click.
+        self._update_cancel.set()
+        self._update_cancel = threading.Event()
+        # Tk variables are read here on the UI thread and passed in as plain
+        # values; the worker never touches the interpreter's variable table.
+        self._update_future = self._io_pool.submit(self._check_for_updates_thread, self._update_cancel,
+                                                   self.mode_var.get(), self.force_refresh_var.get())
+
+    def _check_for_updates_thread(self, cancel, mode, force=False):
         library = self.data_manager.get("library")
         updated_items = []
-        for item_id, item_data in library.items():
-            try:
-                mode = self.mode_var.get()
-                search_results = self.api.search(item_data['title'], mode)
-                latest_data = next((res for res in search_results if res['id'] == item_id), None)
-                if latest_data:
-                    if latest_data['episodes'] > item_data['episodes']:
-                        print(f"Update found for {item_data['title']}: {item_data['episodes']} -> {latest_data['episodes']}")
-                        item_data['episodes'] = latest_data['episodes']
+        detail_futures = []
+        # Items checked within the last UPDATE_CHECK_TTL are skipped
+        # entirely unless the user ticked "Force refresh", so repeat scans
+        # close together finish without touching the network.
+        now = time.time()
+        due = {item_id: item_data for item_id, item_data in library.items()
+               if force or now - item_data.get('_last_checked', 0) >= UPDATE_CHECK_TTL}
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix="ani-update") as ex:
+            # force also skips the response-cache TTL, otherwise a forced
+            # re-scan within the TTL would just re-read the cached counts.
+            futures = {ex.submit(self.api.get_episode_counts, item_data['title'], mode, force): (item_id, item_data)
+                       for item_id, item_data in due.items()}
+            for future in as_completed(futures):
+                if cancel.is_set():
+                    for f in futures: f.cancel()
+                    return
+                item_id, item_data = futures[future]
+                try:
+                    latest_episodes = future.result().get(item_id)
+                    item_data['_last_checked'] = time.time()
+                    if latest_episodes is not None and latest_episodes > item_data['episodes']:
+                        logger.info(f"Update found for {item_data['title']}: {item_data['episodes']} -> {latest_episodes}")
+                        item_data['episodes'] = latest_episodes
+                        # Any cached episode list predates the new episode
+                        # (older library entries stored one); drop it so
+                        # select_anime fetches the fresh list.
+                        item_data.pop('episodes_detail', None)
+                        item_data.pop('detail_mode', None)
                         updated_items.append(item_data)
-                time.sleep(0.5)
-            except Exception as e:
-                print(f"Error checking updates for {item_data['title']}: {e}")
+                        # Kick off the synopsis/cover fetch immediately so
+                        # it overlaps the remainder of the scan instead of
+                        # running serially after it.
+                        detail_futures.append(self._io_pool.submit(self._fetch_details_for_item, item_data))
+                except Exception as e:
+                    logger.warning(f"Error checking updates for {item_data['title']}: {e}")
+        if cancel.is_set():
+            return
+        # Still off the Tk thread: wait for the pipelined detail fetches so
+        # the render posted below finds everything warm in the caches.
+        for f in detail_futures:
+            try:
+                f.result()
+            except Exception:
+                pass
         self.data_manager.set("library", library)
+        # Already off the Tk thread here, so persist immediately rather
+        # than bouncing through the debounced flush.
+        self.data_manager.save_now()
         self.after(0, self._finalize_updates, updated_items)
 
     def _finalize_updates(self, updated_items):
@@ -695,17 +1338,21 @@ class AniCliGUI(ctk.CTk):
         self.check_updates_button.configure(state="normal", text="Check for Updates")
 
     def _populate_updates_frame(self, updated_items=None):
-        for widget in self.updates_frame.winfo_children(): widget.destroy()
+        self._clear_children(self.updates_frame)
         if updated_items is None:
             ctk.CTkLabel(self.updates_frame, text="Click 'Check for Updates' to scan your library.").pack(pady=20)
             return
         if not updated_items:
              ctk.CTkLabel(self.updates_frame, text="No new episodes found.").pack(pady=20)
              return
-        threads = [threading.Thread(target=self._fetch_details_for_item, args=(item,)) for item in updated_items]
-        for t in threads: t.start()
-        for t in threads: t.join()
-        self._populate_anime_results(updated_items, self.updates_frame)
+
+        def fetch_then_render():
+            # Details come off the shared worker pool; only the final paint
+            # hops back onto the Tk thread. The old per-item thread list was
+            # joined here on the UI thread, freezing the mainloop.
+            list(self._io_pool.map(self._fetch_details_for_item, updated_items))
+            self.after(0, self._populate_anime_results, updated_items, self.updates_frame)
+        threading.Thread(target=fetch_then_render, daemon=True).start()
 
 if __name__ == "__main__":
     ctk.set_appearance_mode("system")